@@ -24,6 +24,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--mysql-user", type=str, help="Override MySQL user")
     parser.add_argument("--mysql-password", type=str, help="Override MySQL password")
     parser.add_argument("--mysql-database", type=str, help="Override MySQL database name")
+    parser.add_argument("--workers", type=int, help="Number of worker processes for the transform stage")
+    parser.add_argument("--load-workers", type=int, help="Number of concurrent MySQL loader connections")
+    parser.add_argument("--soft-clear", action="store_true", help="Clear tables with DELETE instead of TRUNCATE")
     parser.add_argument("--echo-sql", action="store_true", help="Enable SQLAlchemy echo for debugging queries")
     return parser.parse_args()
 
@@ -44,6 +47,12 @@ def build_settings(args: argparse.Namespace) -> ETLSettings:
         overrides["mysql_password"] = args.mysql_password
     if args.mysql_database:
         overrides["mysql_database"] = args.mysql_database
+    if args.workers:
+        overrides["transform_workers"] = args.workers
+    if args.load_workers:
+        overrides["load_workers"] = args.load_workers
+    if args.soft_clear:
+        overrides["soft_clear"] = True
     if args.echo_sql:
         overrides["echo_sql"] = True
     return ETLSettings(**overrides)
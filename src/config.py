@@ -19,7 +19,10 @@ class ETLSettings(BaseSettings):
     mysql_password: str = Field(default="6equj5_db_user", description="MySQL password.")
     mysql_database: str = Field(default="home_db", description="Target MySQL database name.")
 
-    batch_size: int = Field(default=1000, ge=1, description="Number of records to insert per batch during loading.")
+    batch_size: int = Field(default=10_000, ge=1, description="Number of records to insert per batch during loading.")
+    transform_workers: int = Field(default=1, ge=1, description="Worker processes for the transform stage (1 runs in-process).")
+    load_workers: int = Field(default=4, ge=1, description="Loader threads, each inserting batches over its own MySQL connection.")
+    soft_clear: bool = Field(default=False, description="Clear tables with DELETE instead of TRUNCATE.")
     echo_sql: bool = Field(default=False, description="Enable SQLAlchemy engine echo for debugging.")
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", env_prefix="ETL_")
@@ -29,6 +32,6 @@ class ETLSettings(BaseSettings):
         """Construct a SQLAlchemy MySQL connection URL."""
 
         return (
-            f"mysql+mysqlconnector://{self.mysql_user}:{self.mysql_password}"  # noqa: S105
+            f"mysql+mysqldb://{self.mysql_user}:{self.mysql_password}"  # noqa: S105
             f"@{self.mysql_host}:{self.mysql_port}/{self.mysql_database}"
         )
@@ -1,11 +1,13 @@
 """Domain models representing the normalized relational schema."""
 from __future__ import annotations
 
+import math
+import re
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, model_validator
 
 from src.utils.cleaning import (
     ensure_sequence,
@@ -16,12 +18,105 @@ from src.utils.cleaning import (
     normalize_string,
 )
 
+Normalizer = Callable[[Any], Any]
+
+# Validation context key carrying the normalizers that still apply to the current batch.
+BATCH_NORMALIZERS = "normalizers"
+
+# Input types a normalizer passes through unchanged (pydantic's lax coercion gives the same result),
+# so a batch column holding only these values or None can skip the per-value call.
+_TYPED_INPUTS: dict[Normalizer, tuple[type, ...]] = {
+    normalize_int: (int,),
+    normalize_float: (int, float),
+    normalize_decimal: (int, float),
+    normalize_bool: (bool,),
+}
+
+
+def _normalize_year(value: Any) -> Optional[int]:
+    year = normalize_int(value)
+    if year and year < 1700:
+        return None
+    if year and year > datetime.utcnow().year:
+        return None
+    return year
+
+
+_ZIP_SEPARATORS = re.compile(r"[ -]").sub
+
+
+def _normalize_zip(value: Any) -> Optional[str]:
+    zip_str = normalize_string(value)
+    if zip_str is None:
+        return None
+    if zip_str.isdigit():
+        # Common case: plain digits need no separator stripping.
+        return zip_str.zfill(5)
+    sanitized = _ZIP_SEPARATORS("", zip_str)
+    if sanitized.isdigit():
+        return sanitized.zfill(5)
+    return zip_str
+
+
+def _is_typed_column(values: Iterable[Any], accepted: tuple[type, ...]) -> bool:
+    for value in values:
+        if value is None:
+            continue
+        kind = type(value)
+        if kind not in accepted:
+            return False
+        if kind is float and not math.isfinite(value):
+            return False
+    return True
+
 
 class CleanBaseModel(BaseModel):
-    """Base model applying shared pydantic configuration."""
+    """Base model applying shared pydantic configuration and input normalization."""
 
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
+    # Field name -> cleaning function, applied in a single pass before field validation.
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {}
+    # Same mapping keyed by every accepted input name (field name and alias).
+    _INPUT_NORMALIZERS: ClassVar[dict[str, Normalizer]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        lookup: dict[str, Normalizer] = {}
+        for name, normalizer in cls._NORMALIZERS.items():
+            lookup[name] = normalizer
+            alias = cls.model_fields[name].alias
+            if alias:
+                lookup[alias] = normalizer
+        cls._INPUT_NORMALIZERS = lookup
+
+    @classmethod
+    def batch_context(cls, payloads: Sequence[dict[str, Any]]) -> dict[str, Any]:
+        """Build a validation context dropping normalizers for columns already typed across the batch."""
+
+        normalizers = {
+            key: normalizer
+            for key, normalizer in cls._INPUT_NORMALIZERS.items()
+            if normalizer not in _TYPED_INPUTS
+            or not _is_typed_column((payload.get(key) for payload in payloads), _TYPED_INPUTS[normalizer])
+        }
+        return {BATCH_NORMALIZERS: normalizers}
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_inputs(cls, data: Any, info: ValidationInfo) -> Any:
+        if not isinstance(data, dict):
+            return data
+        normalizers = cls._INPUT_NORMALIZERS
+        if info.context and BATCH_NORMALIZERS in info.context:
+            normalizers = info.context[BATCH_NORMALIZERS]
+        cleaned = dict(data)
+        for key, normalizer in normalizers.items():
+            if key in cleaned:
+                cleaned[key] = normalizer(cleaned[key])
+        return cleaned
+
 
 class PropertyRecord(CleanBaseModel):
     """Core property entity stored in the `property` table."""
@@ -61,81 +156,38 @@ class PropertyRecord(CleanBaseModel):
     school_average: Optional[float] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
-    @field_validator(
-        "property_title",
-        "address",
-        "market",
-        "flood",
-        "street_address",
-        "city",
-        "state",
-        "property_type",
-        "highway",
-        "train",
-        "htw",
-        "water",
-        "sewage",
-        "parking",
-        "layout",
-        "subdivision",
-        "zip_code",
-    )
-    @classmethod
-    def _normalize_string(cls, value: Any) -> Optional[str]:
-        return normalize_string(value)
-
-    @field_validator("pool", "commercial", "rent_restricted", mode="before")
-    @classmethod
-    def _normalize_bool(cls, value: Any) -> Optional[bool]:
-        return normalize_bool(value)
-
-    @field_validator("tax_rate", mode="before")
-    @classmethod
-    def _normalize_tax(cls, value: Any) -> Optional[Decimal]:
-        return normalize_decimal(value)
-
-    @field_validator(
-        "sqft_basement",
-        "sqft_mixed_use",
-        "sqft_total",
-        "bed",
-        "neighborhood_rating",
-        mode="before",
-    )
-    @classmethod
-    def _normalize_ints(cls, value: Any) -> Optional[int]:
-        return normalize_int(value)
-
-    @field_validator("bath", "latitude", "longitude", "school_average", mode="before")
-    @classmethod
-    def _normalize_float(cls, value: Any) -> Optional[float]:
-        return normalize_float(value)
-
-    @field_validator("year_built", mode="before")
-    @classmethod
-    def _normalize_year(cls, value: Any) -> Optional[int]:
-        year = normalize_int(value)
-        if year and year < 1700:
-            return None
-        if year and year > datetime.utcnow().year:
-            return None
-        return year
-
-    @field_validator("basement", mode="before")
-    @classmethod
-    def _normalize_basement(cls, value: Any) -> Optional[bool]:
-        return normalize_bool(value)
-
-    @field_validator("zip_code", mode="wrap")
-    @classmethod
-    def _normalize_zip(cls, value: Optional[str], handler):
-        zip_str = handler(value)
-        if zip_str is None:
-            return None
-        sanitized = zip_str.replace(" ", "").replace("-", "")
-        if sanitized.isdigit():
-            return sanitized.zfill(5)
-        return zip_str
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {
+        **dict.fromkeys(
+            (
+                "property_title",
+                "address",
+                "market",
+                "flood",
+                "street_address",
+                "city",
+                "state",
+                "property_type",
+                "highway",
+                "train",
+                "htw",
+                "water",
+                "sewage",
+                "parking",
+                "layout",
+                "subdivision",
+            ),
+            normalize_string,
+        ),
+        **dict.fromkeys(("pool", "commercial", "rent_restricted", "basement"), normalize_bool),
+        "tax_rate": normalize_decimal,
+        **dict.fromkeys(
+            ("sqft_basement", "sqft_mixed_use", "sqft_total", "bed", "neighborhood_rating"),
+            normalize_int,
+        ),
+        **dict.fromkeys(("bath", "latitude", "longitude", "school_average"), normalize_float),
+        "year_built": _normalize_year,
+        "zip_code": _normalize_zip,
+    }
 
 
 class LeadRecord(CleanBaseModel):
@@ -152,20 +204,14 @@ class LeadRecord(CleanBaseModel):
     seller_retained_broker: Optional[bool] = Field(default=None)
     final_reviewer: Optional[str] = Field(default=None)
 
-    @field_validator("reviewed_status", "most_recent_status", "source", "occupancy", "selling_reason", "final_reviewer")
-    @classmethod
-    def _normalize_text(cls, value: Any) -> Optional[str]:
-        return normalize_string(value)
-
-    @field_validator("net_yield", "irr", mode="before")
-    @classmethod
-    def _normalize_numeric(cls, value: Any) -> Optional[float]:
-        return normalize_float(value)
-
-    @field_validator("seller_retained_broker", mode="before")
-    @classmethod
-    def _normalize_bool(cls, value: Any) -> Optional[bool]:
-        return normalize_bool(value)
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {
+        **dict.fromkeys(
+            ("reviewed_status", "most_recent_status", "source", "occupancy", "selling_reason", "final_reviewer"),
+            normalize_string,
+        ),
+        **dict.fromkeys(("net_yield", "irr"), normalize_float),
+        "seller_retained_broker": normalize_bool,
+    }
 
 
 class ValuationRecord(CleanBaseModel):
@@ -183,21 +229,20 @@ class ValuationRecord(CleanBaseModel):
     redfin_value: Optional[Decimal] = Field(default=None)
     zestimate: Optional[Decimal] = Field(default=None)
 
-    @field_validator(
-        "list_price",
-        "previous_rent",
-        "arv",
-        "expected_rent",
-        "rent_zestimate",
-        "low_fmr",
-        "high_fmr",
-        "redfin_value",
-        "zestimate",
-        mode="before",
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = dict.fromkeys(
+        (
+            "list_price",
+            "previous_rent",
+            "arv",
+            "expected_rent",
+            "rent_zestimate",
+            "low_fmr",
+            "high_fmr",
+            "redfin_value",
+            "zestimate",
+        ),
+        normalize_decimal,
     )
-    @classmethod
-    def _normalize_money(cls, value: Any) -> Optional[Decimal]:
-        return normalize_decimal(value)
 
 
 class RehabRecord(CleanBaseModel):
@@ -219,28 +264,25 @@ class RehabRecord(CleanBaseModel):
     landscaping_flag: Optional[bool] = Field(default=None)
     trashout_flag: Optional[bool] = Field(default=None)
 
-    @field_validator("underwriting_rehab", "rehab_calculation", mode="before")
-    @classmethod
-    def _normalize_cost(cls, value: Any) -> Optional[Decimal]:
-        return normalize_decimal(value)
-
-    @field_validator(
-        "paint",
-        "flooring_flag",
-        "foundation_flag",
-        "roof_flag",
-        "hvac_flag",
-        "kitchen_flag",
-        "bathroom_flag",
-        "appliances_flag",
-        "windows_flag",
-        "landscaping_flag",
-        "trashout_flag",
-        mode="before",
-    )
-    @classmethod
-    def _normalize_flag(cls, value: Any) -> Optional[bool]:
-        return normalize_bool(value)
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {
+        **dict.fromkeys(("underwriting_rehab", "rehab_calculation"), normalize_decimal),
+        **dict.fromkeys(
+            (
+                "paint",
+                "flooring_flag",
+                "foundation_flag",
+                "roof_flag",
+                "hvac_flag",
+                "kitchen_flag",
+                "bathroom_flag",
+                "appliances_flag",
+                "windows_flag",
+                "landscaping_flag",
+                "trashout_flag",
+            ),
+            normalize_bool,
+        ),
+    }
 
 
 class HOARecord(CleanBaseModel):
@@ -251,15 +293,10 @@ class HOARecord(CleanBaseModel):
     hoa_amount: Optional[Decimal] = Field(default=None, alias="hoa")
     hoa_flag: Optional[bool] = Field(default=None)
 
-    @field_validator("hoa_amount", mode="before")
-    @classmethod
-    def _normalize_amount(cls, value: Any) -> Optional[Decimal]:
-        return normalize_decimal(value)
-
-    @field_validator("hoa_flag", mode="before")
-    @classmethod
-    def _normalize_flag(cls, value: Any) -> Optional[bool]:
-        return normalize_bool(value)
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {
+        "hoa_amount": normalize_decimal,
+        "hoa_flag": normalize_bool,
+    }
 
 
 class TaxRecord(CleanBaseModel):
@@ -268,14 +305,21 @@ class TaxRecord(CleanBaseModel):
     property_key: str
     amount: Optional[Decimal] = Field(default=None, alias="taxes")
 
-    @field_validator("amount", mode="before")
-    @classmethod
-    def _normalize_amount(cls, value: Any) -> Optional[Decimal]:
-        return normalize_decimal(value)
+    _NORMALIZERS: ClassVar[dict[str, Normalizer]] = {"amount": normalize_decimal}
+
+
+# List adapters validate a whole batch of payloads in a single pydantic-core call.
+PROPERTY_ADAPTER = TypeAdapter(list[PropertyRecord])
+LEAD_ADAPTER = TypeAdapter(list[LeadRecord])
+VALUATION_ADAPTER = TypeAdapter(list[ValuationRecord])
+REHAB_ADAPTER = TypeAdapter(list[RehabRecord])
+HOA_ADAPTER = TypeAdapter(list[HOARecord])
+TAX_ADAPTER = TypeAdapter(list[TaxRecord])
 
 
-def iter_scenarios(raw_value: Any) -> list[tuple[int, dict[str, Any]]]:
-    """Flatten nested scenario lists into enumerated dictionaries."""
+def iter_scenarios(raw_value: Any) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Flatten nested scenario lists into enumerated dictionaries, ranked from 1."""
 
-    items = ensure_sequence(raw_value)
-    return [(index + 1, dict(item)) for index, item in enumerate(items)]
+    for rank, item in enumerate(ensure_sequence(raw_value), start=1):
+        # Scenarios are only read, so parsed dicts are yielded as-is rather than copied.
+        yield rank, item if isinstance(item, dict) else dict(item)
@@ -2,26 +2,40 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
 
 import pandas as pd
+from sqlalchemy import Connection
 
 from src.config import ETLSettings
 from src.pipeline.io.reader import RawDatasetReader
 from src.pipeline.loader.mysql_loader import SQLAlchemyLoader
-from src.pipeline.transform import DatasetTransformer
+from src.pipeline.transform import DatasetTransformer, NormalizedBundle
 
 LOGGER = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
 class PipelineSummary:
-    properties: int
-    leads: int
-    valuations: int
-    rehabs: int
-    hoas: int
-    taxes: int
+    properties: int = 0
+    leads: int = 0
+    valuations: int = 0
+    rehabs: int = 0
+    hoas: int = 0
+    taxes: int = 0
+
+    def add(self, bundle: NormalizedBundle) -> None:
+        self.properties += len(bundle.properties)
+        self.leads += len(bundle.leads)
+        self.valuations += len(bundle.valuations)
+        self.rehabs += len(bundle.rehabs)
+        self.hoas += len(bundle.hoas)
+        self.taxes += len(bundle.taxes)
 
     def as_dict(self) -> dict[str, int]:
         return {
@@ -35,46 +49,143 @@ class PipelineSummary:
 
 
 def run_pipeline(settings: ETLSettings | None = None, *, dry_run: bool = False) -> PipelineSummary:
-    """Execute the ETL pipeline end-to-end."""
+    """Execute the ETL pipeline end-to-end, streaming records from reader to loader in batches."""
 
     settings = settings or ETLSettings()
 
-    LOGGER.info("Reading raw dataset from %s", settings.data_path)
-    reader = RawDatasetReader(settings.data_path)
-    raw_records = reader.load()
-    LOGGER.info("Loaded %d raw property records", len(raw_records))
-
     LOGGER.info("Loading field configuration from %s", settings.field_config_path)
-    field_config = pd.read_excel(settings.field_config_path)
-
+    config_path = settings.field_config_path
+    field_config = _load_field_config(config_path, config_path.stat().st_mtime_ns)
     transformer = DatasetTransformer(field_config=field_config)
-    bundle = transformer.transform(raw_records)
-
-    summary = PipelineSummary(
-        properties=len(bundle.properties),
-        leads=len(bundle.leads),
-        valuations=len(bundle.valuations),
-        rehabs=len(bundle.rehabs),
-        hoas=len(bundle.hoas),
-        taxes=len(bundle.taxes),
-    )
 
-    LOGGER.info("Transform complete: %s", summary.as_dict())
+    LOGGER.info("Streaming raw dataset from %s", settings.data_path)
+    reader = RawDatasetReader(settings.data_path)
+    if settings.transform_workers > 1:
+        LOGGER.info("Transforming with %d worker processes", settings.transform_workers)
+        batches = transformer.iter_bundles_parallel(
+            reader.stream(),
+            batch_size=settings.batch_size,
+            workers=settings.transform_workers,
+        )
+    else:
+        batches = transformer.iter_bundles(reader.stream(), settings.batch_size)
+    summary = PipelineSummary()
 
     if dry_run:
         LOGGER.info("Dry-run enabled: skipping MySQL load stage")
+        for batch in batches:
+            summary.add(batch)
+        LOGGER.info("Transform complete: %s", summary.as_dict())
         return summary
 
-    loader = SQLAlchemyLoader.from_url(settings.sqlalchemy_url, echo=settings.echo_sql)
+    loader = SQLAlchemyLoader.from_url(
+        settings.sqlalchemy_url,
+        echo=settings.echo_sql,
+        batch_size=settings.batch_size,
+        # Each loader thread holds a pooled connection for the whole run.
+        pool_size=max(settings.load_workers, 5),
+    )
     LOGGER.info("Persisting bundle into MySQL at %s", settings.sqlalchemy_url)
-    with loader.session_scope() as session:
-        loader.clear_existing_data(session)
-        loader.insert_properties(session, bundle.properties)
-        loader.insert_leads(session, bundle.leads)
-        loader.insert_taxes(session, bundle.taxes)
-        loader.insert_valuations(session, bundle.valuations)
-        loader.insert_rehabs(session, bundle.rehabs)
-        loader.insert_hoas(session, bundle.hoas)
-
-    LOGGER.info("Load phase complete")
+    if settings.soft_clear:
+        # DELETE is transactional, so it shares one transaction with the load and a failed run keeps the
+        # previous rows. Rerun keys would lock-wait across connections, so this path loads over one connection.
+        with loader.connection_scope() as connection:
+            loader.clear_existing_data(connection, soft=True)
+            for batch in batches:
+                _load_batch(loader, connection, batch)
+                summary.add(batch)
+                LOGGER.debug("Loaded batch: %s", summary.as_dict())
+    else:
+        # TRUNCATE commits implicitly, so a load that fails after it leaves the tables empty.
+        with loader.connection_scope() as connection:
+            loader.clear_existing_data(connection)
+        _load_concurrently(loader, batches, summary, workers=settings.load_workers)
+
+    LOGGER.info("Load phase complete: %s", summary.as_dict())
     return summary
+
+
+@lru_cache(maxsize=4)
+def _load_field_config(path: Path, mtime_ns: int) -> pd.DataFrame:
+    # Keyed by modification time so an edited workbook is re-read while repeated runs in one process
+    # reuse the parse. The calamine engine parses the workbook natively instead of through openpyxl.
+    return pd.read_excel(path, engine="calamine")
+
+
+def _load_concurrently(
+    loader: SQLAlchemyLoader,
+    batches: Iterable[NormalizedBundle],
+    summary: PipelineSummary,
+    *,
+    workers: int,
+) -> None:
+    """Overlap transform and load: this thread produces batches while loader threads insert them.
+
+    Each loader thread holds one connection and one transaction for the whole run. Batches carry complete
+    records, so foreign keys never span connections. The threads wait for each other once their batches are
+    loaded, then all commit at the same time; any failure before that point rolls every transaction back. The
+    run is not atomic across connections: if one commit fails, rows from commits that succeeded remain.
+    """
+
+    work: queue.Queue[NormalizedBundle | None] = queue.Queue(maxsize=workers * 2)
+    failed = threading.Event()
+    errors: list[BaseException] = []
+    barrier = threading.Barrier(workers)
+
+    def consume() -> None:
+        drained = False
+        try:
+            with loader.engine.connect() as connection:
+                transaction = connection.begin()
+                while (batch := work.get()) is not None:
+                    if not failed.is_set():  # after a failure, keep draining so the producer never blocks
+                        _load_batch(loader, connection, batch)
+                drained = True
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    # Another loader failed; its error is already recorded.
+                    transaction.rollback()
+                    return
+                if failed.is_set():
+                    transaction.rollback()
+                else:
+                    transaction.commit()
+        except BaseException as exc:  # noqa: BLE001 - surfaced to the caller below
+            errors.append(exc)
+            failed.set()
+            barrier.abort()
+            if not drained:
+                while work.get() is not None:
+                    pass
+
+    threads = [threading.Thread(target=consume, name=f"mysql-loader-{index}") for index in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for batch in batches:
+            if failed.is_set():
+                break
+            work.put(batch)
+            summary.add(batch)
+            LOGGER.debug("Queued batch: %s", summary.as_dict())
+    except BaseException:
+        failed.set()
+        raise
+    finally:
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _load_batch(loader: SQLAlchemyLoader, connection: Connection, batch: NormalizedBundle) -> None:
+    # Parents first: every batch holds complete records, so child rows always follow their property.
+    loader.insert_properties_fast(connection, batch.properties)
+    loader.insert_leads(connection, batch.leads)
+    loader.insert_taxes(connection, batch.taxes)
+    loader.insert_valuations(connection, batch.valuations)
+    loader.insert_rehabs(connection, batch.rehabs)
+    loader.insert_hoas(connection, batch.hoas)
@@ -1,23 +1,72 @@
 """Dataset readers handling the relaxed JSON format."""
 from __future__ import annotations
 
+import hashlib
+from itertools import islice
 from pathlib import Path
 from typing import Iterable
 
+import ijson
+import orjson
 import yaml
 
 from src.utils.cleaning import ensure_sequence
 
+# Prefer the libyaml-backed loader when PyYAML was built against it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class DatasetParseError(ValueError):
+    """Raised when the streamed and relaxed parses of the dataset disagree."""
+
 
 class RawDatasetReader:
-    """Load the raw property dataset into memory using YAML parser."""
+    """Load the raw property dataset, parsing strict JSON first and relaxed JSON via YAML."""
 
     def __init__(self, path: Path) -> None:
         self.path = path
 
     def load(self) -> list[dict[str, object]]:
-        return ensure_sequence(yaml.safe_load(self.path.read_text(encoding="utf-8")))
+        data = self.path.read_bytes()
+        try:
+            payload = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return self._load_relaxed(data)
+        return ensure_sequence(payload)
+
+    def _load_relaxed(self, data: bytes | None = None) -> list[dict[str, object]]:
+        if data is None:
+            data = self.path.read_bytes()
+        return ensure_sequence(yaml.load(data.decode("utf-8"), Loader=_YAML_LOADER))
 
     def stream(self) -> Iterable[dict[str, object]]:
-        for record in ensure_sequence(yaml.safe_load(self.path.read_text(encoding="utf-8"))):
-            yield record
+        emitted: list[bytes] = []
+        try:
+            with self.path.open("rb") as handle:
+                for record in ijson.items(handle, "item", use_float=True):
+                    emitted.append(_record_digest(record))
+                    yield record
+        except ijson.JSONError:
+            # Relaxed payloads (bare tokens such as ``9191 sqfts``) are not valid JSON; resume from
+            # the YAML parse, skipping the records the incremental parser already produced. The strict
+            # JSON attempt in ``load`` is bypassed since the incremental parser has already rejected it.
+            records = self._load_relaxed()
+            # The two parsers type some literals differently (YAML reads ``1e5`` as a string), so the
+            # resumed stream is only valid if YAML agrees with every record already emitted.
+            for position, (digest, record) in enumerate(zip(emitted, records)):
+                if _record_digest(record) != digest:
+                    raise DatasetParseError(
+                        f"{self.path}: record {position} parses differently as JSON and as relaxed JSON; "
+                        "use load() for a consistent parse"
+                    )
+            yield from islice(records, len(emitted), None)
+            return
+        if not emitted:
+            # Top-level objects or scalars are not addressable through the ``item`` prefix.
+            yield from self.load()
+
+
+def _record_digest(record: object) -> bytes:
+    # Compare by digest so the fallback check keeps 16 bytes per record rather than the records themselves.
+    payload = orjson.dumps(record, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
@@ -1,15 +1,40 @@
 """SQLAlchemy-based loader for inserting normalized records into MySQL."""
 from __future__ import annotations
 
+import csv
+import logging
+import tempfile
 from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+from pathlib import Path
 from typing import Generator, Sequence
 
-from sqlalchemy import Engine, Table, create_engine
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy import Connection, Engine, Insert, Table, create_engine, make_url
+from sqlalchemy.exc import DBAPIError
 
 from src.models.property import HOARecord, LeadRecord, PropertyRecord, RehabRecord, TaxRecord, ValuationRecord
-from src.models.tables import hoa_table, leads_table, property_table, rehab_table, taxes_table, valuation_table
+from src.models.tables import (
+    hoa_table,
+    leads_table,
+    metadata,
+    property_table,
+    rehab_table,
+    taxes_table,
+    valuation_table,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Escape sequences understood by LOAD DATA with the default ``ESCAPED BY '\\'``.
+_INFILE_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\0": "\\0"})
+_INFILE_NULL = "\\N"
+
+
+# Errors meaning the LOCAL capability is disabled: ER_NOT_ALLOWED_COMMAND, ER_CLIENT_LOCAL_FILES_DISABLED and
+# CR_LOAD_DATA_LOCAL_INFILE_REJECTED.
+_LOCAL_INFILE_REJECTED = frozenset({1148, 3948, 2068})
 
 
 class LoaderError(RuntimeError):
@@ -17,66 +42,176 @@ class LoaderError(RuntimeError):
 
 
 class SQLAlchemyLoader:
-    """Persist domain objects into database tables using SQLAlchemy ORM mappings."""
+    """Persist domain objects into database tables using SQLAlchemy Core statements."""
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, batch_size: int = 10_000) -> None:
         self.engine = engine
+        self.batch_size = batch_size
+        self._load_data_enabled = engine.dialect.name == "mysql"
+        self._projections: dict[tuple[Table, type], tuple[tuple[str, ...], itemgetter]] = {}
+        # Build each INSERT construct once; SQLAlchemy's compiled cache then reuses its SQL across batches.
+        self._inserts: dict[Table, Insert] = {table: table.insert() for table in metadata.tables.values()}
 
     @contextmanager
-    def session_scope(self) -> Generator[Session, None, None]:
-        session = Session(self.engine)
+    def connection_scope(self) -> Generator[Connection, None, None]:
+        """Open a Core connection whose transaction commits on success and rolls back on error."""
+
+        with self.engine.begin() as connection:
+            yield connection
+
+    @classmethod
+    def from_url(
+        cls, url: str, echo: bool = False, batch_size: int = 10_000, pool_size: int = 5
+    ) -> "SQLAlchemyLoader":
+        connect_args: dict[str, object] = {}
+        if make_url(url).get_driver_name() == "mysqldb":
+            # Allow the client side of LOAD DATA LOCAL INFILE for bulk property loads.
+            connect_args["local_infile"] = 1
+        engine = create_engine(url, echo=echo, future=True, pool_size=pool_size, connect_args=connect_args)
+        return cls(engine, batch_size=batch_size)
+
+    def insert_properties(self, connection: Connection, properties: Sequence[PropertyRecord]) -> None:
+        self._bulk_insert(connection, property_table, properties)
+
+    def insert_properties_fast(self, connection: Connection, properties: Sequence[PropertyRecord]) -> None:
+        """Bulk load properties with LOAD DATA LOCAL INFILE, falling back to batched INSERTs."""
+
+        if not properties:
+            return
+        rows = self._project_rows(property_table, properties)
+        if not self._load_data_enabled:
+            self._execute_chunks(connection, property_table, rows)
+            return
+
+        column_names, _ = self._projection(property_table, type(properties[0]))
+        handle = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", newline="", suffix=".csv", prefix="property_", delete=False
+        )
+        path = Path(handle.name)
         try:
-            yield session
-            session.commit()
-        except SQLAlchemyError as exc:  # pragma: no cover - passthrough
-            session.rollback()
-            raise
+            with handle:
+                writer = csv.writer(handle, lineterminator="\n")
+                for row in rows:
+                    writer.writerow([_to_infile_value(value) for value in row.values()])
+            # The path goes in as a driver parameter: temp directories may contain quotes (C:/Users/O'Brien/...).
+            statement = (
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE {property_table.name} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                "LINES TERMINATED BY '\\n' "
+                f"({', '.join(column_names)})"
+            )
+            try:
+                connection.exec_driver_sql(statement, (path.as_posix(),))
+            except DBAPIError as exc:
+                # Only a disabled LOCAL capability is recoverable; anything else (a deadlock, say) may have
+                # rolled back the whole transaction, so retrying on this connection would lose earlier batches.
+                if _mysql_error_code(exc) not in _LOCAL_INFILE_REJECTED:
+                    raise
+                LOGGER.warning("LOAD DATA LOCAL INFILE rejected (%s); falling back to batched INSERTs", exc.orig)
+                self._load_data_enabled = False
+                self._execute_chunks(connection, property_table, rows)
+                return
+            self._raise_on_load_warnings(connection)
         finally:
-            session.close()
+            path.unlink(missing_ok=True)
 
-    @classmethod
-    def from_url(cls, url: str, echo: bool = False) -> "SQLAlchemyLoader":
-        engine = create_engine(url, echo=echo, future=True)
-        return cls(engine)
+    @staticmethod
+    def _raise_on_load_warnings(connection: Connection) -> None:
+        # LOCAL implies IGNORE, so duplicate keys and truncated values only raise warnings. Treat them as
+        # errors to match the strict-mode INSERT path. SHOW WARNINGS must come first: it is a diagnostic
+        # statement, whereas ``SELECT @@warning_count`` would clear the list it reports on.
+        problems = [row for row in connection.exec_driver_sql("SHOW WARNINGS") if row[0] != "Note"]
+        if problems:
+            details = "; ".join(f"{code}: {message}" for _, code, message in problems[:5])
+            raise LoaderError(f"LOAD DATA into {property_table.name} reported warnings: {details}")
 
-    def insert_properties(self, session: Session, properties: Sequence[PropertyRecord]) -> None:
-        self._bulk_insert(session, property_table, properties)
+    def insert_leads(self, connection: Connection, leads: Sequence[LeadRecord]) -> None:
+        self._bulk_insert(connection, leads_table, leads)
 
-    def insert_leads(self, session: Session, leads: Sequence[LeadRecord]) -> None:
-        self._bulk_insert(session, leads_table, leads)
+    def insert_valuations(self, connection: Connection, valuations: Sequence[ValuationRecord]) -> None:
+        self._bulk_insert(connection, valuation_table, valuations)
 
-    def insert_valuations(self, session: Session, valuations: Sequence[ValuationRecord]) -> None:
-        self._bulk_insert(session, valuation_table, valuations)
+    def insert_rehabs(self, connection: Connection, rehabs: Sequence[RehabRecord]) -> None:
+        self._bulk_insert(connection, rehab_table, rehabs)
 
-    def insert_rehabs(self, session: Session, rehabs: Sequence[RehabRecord]) -> None:
-        self._bulk_insert(session, rehab_table, rehabs)
+    def insert_hoas(self, connection: Connection, hoas: Sequence[HOARecord]) -> None:
+        self._bulk_insert(connection, hoa_table, hoas)
 
-    def insert_hoas(self, session: Session, hoas: Sequence[HOARecord]) -> None:
-        self._bulk_insert(session, hoa_table, hoas)
+    def insert_taxes(self, connection: Connection, taxes: Sequence[TaxRecord]) -> None:
+        self._bulk_insert(connection, taxes_table, taxes)
 
-    def insert_taxes(self, session: Session, taxes: Sequence[TaxRecord]) -> None:
-        self._bulk_insert(session, taxes_table, taxes)
+    def clear_existing_data(self, connection: Connection, soft: bool = False) -> None:
+        """Remove existing rows to keep reruns idempotent.
 
-    def clear_existing_data(self, session: Session) -> None:
-        """Remove existing rows to keep reruns idempotent."""
+        MySQL tables are truncated, which deallocates them instead of logging every deleted row. ``soft`` keeps
+        the row-by-row DELETE for servers where the account lacks the DROP privilege TRUNCATE requires.
+        """
 
-        # Delete in dependency order so child tables are cleared before parent table.
-        for table in (valuation_table, rehab_table, hoa_table, taxes_table, leads_table, property_table):
-            session.execute(table.delete())
+        # Child tables come before the parent table so the DELETE path never trips a foreign key.
+        tables = (valuation_table, rehab_table, hoa_table, taxes_table, leads_table, property_table)
+        if soft or connection.dialect.name != "mysql":
+            for table in tables:
+                connection.execute(table.delete())
+            return
+
+        quote = connection.dialect.identifier_preparer.quote
+        # TRUNCATE refuses tables referenced by a foreign key unless checks are off for the session.
+        connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in tables:
+                connection.exec_driver_sql(f"TRUNCATE TABLE {quote(table.name)}")
+        finally:
+            connection.exec_driver_sql("SET FOREIGN_KEY_CHECKS = 1")
 
-    def _bulk_insert(self, session: Session, table: Table, models: Sequence) -> None:
+    def _bulk_insert(self, connection: Connection, table: Table, models: Sequence) -> None:
         if not models:
             return
-        column_names = {column.name for column in table.columns}
-        payload: list[dict[str, object]] = []
-        for model in models:
-            if hasattr(model, "model_dump"):
-                dump = model.model_dump(mode="python", by_alias=True, exclude_unset=False)
-            else:  # pragma: no cover - defensive
-                dump = dict(model)
-
-            # Ensure all table columns are present; fallback to None when missing so SQLAlchemy
-            # does not request an undefined bind parameter during bulk inserts.
-            normalized_row = {name: dump.get(name) for name in column_names}
-            payload.append(normalized_row)
-        session.execute(table.insert(), payload)
+        self._execute_chunks(connection, table, self._project_rows(table, models))
+
+    def _execute_chunks(self, connection: Connection, table: Table, payload: list[dict[str, object]]) -> None:
+        # Executemany in bounded chunks: the driver rewrites each chunk into a multi-row
+        # INSERT ... VALUES statement, and the chunk size keeps packets under max_allowed_packet.
+        for start in range(0, len(payload), self.batch_size):
+            connection.execute(self._inserts[table], payload[start : start + self.batch_size])
+
+    def _project_rows(self, table: Table, models: Sequence) -> list[dict[str, object]]:
+        model_type = type(models[0])
+        columns, getter = self._projection(table, model_type)
+        # Equivalent to ``model_dump(mode="python")`` (field names, not aliases) without the per-call
+        # argument handling of the BaseModel wrapper.
+        serialize = model_type.__pydantic_serializer__.to_python
+        return [dict(zip(columns, getter(serialize(model)))) for model in models]
+
+    def _projection(self, table: Table, model_type: type) -> tuple[tuple[str, ...], itemgetter]:
+        """Return the table's column names and a getter pulling them from a model dump, built once per pair."""
+
+        key = (table, model_type)
+        projection = self._projections.get(key)
+        if projection is None:
+            columns = tuple(column.name for column in table.columns)
+            missing = set(columns).difference(model_type.model_fields)
+            if missing:
+                raise LoaderError(f"{model_type.__name__} has no fields for {table.name} columns: {sorted(missing)}")
+            projection = (columns, itemgetter(*columns))
+            self._projections[key] = projection
+        return projection
+
+
+def _to_infile_value(value: object) -> str:
+    """Render a Python value as a LOAD DATA field (``\\N`` for NULL, escaped text otherwise)."""
+
+    if value is None:
+        return _INFILE_NULL
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return str(value).translate(_INFILE_ESCAPES)
+
+
+def _mysql_error_code(exc: DBAPIError) -> int | None:
+    args = getattr(exc.orig, "args", ())
+    return args[0] if args and isinstance(args[0], int) else None
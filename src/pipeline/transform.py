@@ -2,12 +2,27 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass
-from typing import Iterable, Iterator
+import multiprocessing
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Iterable, Iterator
 
 import pandas as pd
+from pydantic import TypeAdapter
 
 from src.models.property import (
+    HOA_ADAPTER,
+    LEAD_ADAPTER,
+    PROPERTY_ADAPTER,
+    REHAB_ADAPTER,
+    TAX_ADAPTER,
+    VALUATION_ADAPTER,
+    CleanBaseModel,
     HOARecord,
     LeadRecord,
     PropertyRecord,
@@ -18,17 +33,72 @@ from src.models.property import (
 )
 from src.utils.cleaning import normalize_string
 
+_SNAKE_SEPARATORS = str.maketrans({" ": "_", "-": "_"})
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z])").sub
+
+# Record fields hashed, in order, into the property key.
+_KEY_FIELDS = ("Street_Address", "City", "State", "Zip")
+
+# ``(raw_key, target_column)`` pairs of a field map, in projection order.
+FieldItems = tuple[tuple[str, str], ...]
+Projector = Callable[[dict[str, object] | None], dict[str, object]]
+
 
 @dataclass(slots=True)
 class NormalizedBundle:
     """Container holding all derived entities for persistence."""
 
-    properties: list[PropertyRecord]
-    leads: list[LeadRecord]
-    valuations: list[ValuationRecord]
-    rehabs: list[RehabRecord]
-    hoas: list[HOARecord]
-    taxes: list[TaxRecord]
+    properties: list[PropertyRecord] = field(default_factory=list)
+    leads: list[LeadRecord] = field(default_factory=list)
+    valuations: list[ValuationRecord] = field(default_factory=list)
+    rehabs: list[RehabRecord] = field(default_factory=list)
+    hoas: list[HOARecord] = field(default_factory=list)
+    taxes: list[TaxRecord] = field(default_factory=list)
+
+    def extend(self, other: NormalizedBundle) -> None:
+        self.properties.extend(other.properties)
+        self.leads.extend(other.leads)
+        self.valuations.extend(other.valuations)
+        self.rehabs.extend(other.rehabs)
+        self.hoas.extend(other.hoas)
+        self.taxes.extend(other.taxes)
+
+
+@dataclass(slots=True)
+class _PendingPayloads:
+    """Projected raw payloads accumulated for a batch, awaiting validation."""
+
+    properties: list[dict[str, object]] = field(default_factory=list)
+    leads: list[dict[str, object]] = field(default_factory=list)
+    valuations: list[dict[str, object]] = field(default_factory=list)
+    rehabs: list[dict[str, object]] = field(default_factory=list)
+    hoas: list[dict[str, object]] = field(default_factory=list)
+    taxes: list[dict[str, object]] = field(default_factory=list)
+
+    def largest_table_size(self) -> int:
+        return max(
+            len(self.properties),
+            len(self.leads),
+            len(self.valuations),
+            len(self.rehabs),
+            len(self.hoas),
+            len(self.taxes),
+        )
+
+    def validate(self) -> NormalizedBundle:
+        return NormalizedBundle(
+            properties=_validate_batch(PROPERTY_ADAPTER, PropertyRecord, self.properties),
+            leads=_validate_batch(LEAD_ADAPTER, LeadRecord, self.leads),
+            valuations=_validate_batch(VALUATION_ADAPTER, ValuationRecord, self.valuations),
+            rehabs=_validate_batch(REHAB_ADAPTER, RehabRecord, self.rehabs),
+            hoas=_validate_batch(HOA_ADAPTER, HOARecord, self.hoas),
+            taxes=_validate_batch(TAX_ADAPTER, TaxRecord, self.taxes),
+        )
+
+
+def _validate_batch(adapter: TypeAdapter, model: type[CleanBaseModel], payloads: list[dict[str, object]]) -> list:
+    # Column-wise pass first: normalizers are skipped for columns whose values already carry the target type.
+    return adapter.validate_python(payloads, context=model.batch_context(payloads))
 
 
 class DatasetTransformer:
@@ -36,6 +106,7 @@ class DatasetTransformer:
 
     def __init__(self, field_config: pd.DataFrame | None = None) -> None:
         self.field_config = field_config
+        self._columns_by_table = self._group_columns_by_table(field_config)
 
         self.property_fields = self._build_field_map(
             table_name="property",
@@ -51,96 +122,163 @@ class DatasetTransformer:
         self.hoa_fields = self._build_field_map("hoa")
         self.tax_fields = self._build_field_map("taxes", overrides={"Taxes": "amount"})
 
+        self._compile_projectors()
+
+    def __getstate__(self) -> dict[str, object]:
+        # Generated projectors cannot be pickled; workers recompile them from the field maps.
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_project_")}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._compile_projectors()
+
+    def _compile_projectors(self) -> None:
+        # Projection runs once per record per table, so each field map gets a straight-line function.
+        self._project_property = _compile_projector(tuple(self.property_fields.items()))
+        self._project_lead = _compile_projector(tuple(self.lead_fields.items()))
+        self._project_valuation = _compile_projector(tuple(self.valuation_fields.items()))
+        self._project_rehab = _compile_projector(tuple(self.rehab_fields.items()))
+        self._project_hoa = _compile_projector(tuple(self.hoa_fields.items()))
+        self._project_tax = _compile_projector(tuple(self.tax_fields.items()))
+
     def transform(self, records: Iterable[dict[str, object]]) -> NormalizedBundle:
-        properties: list[PropertyRecord] = []
-        leads: list[LeadRecord] = []
-        valuations: list[ValuationRecord] = []
-        rehabs: list[RehabRecord] = []
-        hoas: list[HOARecord] = []
-        taxes: list[TaxRecord] = []
-        seen_properties: set[str] = set()
+        return next(self.iter_bundles(records), NormalizedBundle())
+
+    def iter_bundles(
+        self,
+        records: Iterable[dict[str, object]],
+        batch_size: int | None = None,
+    ) -> Iterator[NormalizedBundle]:
+        """Lazily transform raw records into validated bundles.
+
+        Payloads are validated per table in one call once any table reaches ``batch_size`` rows;
+        ``None`` validates everything as a single bundle.
+        """
+
+        yield from self.iter_keyed_bundles(self.iter_unique_records(records), batch_size)
+
+    def transform_parallel(
+        self,
+        records: Iterable[dict[str, object]],
+        workers: int | None = None,
+        batch_size: int = 1000,
+    ) -> NormalizedBundle:
+        """Parallel counterpart of :meth:`transform`, merging the per-chunk bundles in input order."""
+
+        merged = NormalizedBundle()
+        workers = workers or os.cpu_count() or 1
+        for bundle in self.iter_bundles_parallel(records, batch_size=batch_size, workers=workers):
+            merged.extend(bundle)
+        return merged
 
+    def iter_bundles_parallel(
+        self,
+        records: Iterable[dict[str, object]],
+        *,
+        batch_size: int,
+        workers: int,
+    ) -> Iterator[NormalizedBundle]:
+        """Fan chunks of unique records out to worker processes, yielding bundles in input order.
+
+        De-duplication stays in this process because property keys depend on each record's global position.
+        """
+
+        keyed_records = self.iter_unique_records(records)
+        # Spawn rather than fork: the pool starts lazily, by which point the caller may already run loader
+        # threads holding database connections that a forked child would inherit.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_transform_worker,
+            initargs=(self,),
+        ) as pool:
+            in_flight: deque[Future[list[NormalizedBundle]]] = deque()
+            while chunk := list(islice(keyed_records, batch_size)):
+                in_flight.append(pool.submit(_transform_chunk, chunk, batch_size))
+                # Keep at most two chunks per worker queued so memory stays bounded while streaming.
+                if len(in_flight) >= workers * 2:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+
+    def iter_unique_records(self, records: Iterable[dict[str, object]]) -> Iterator[tuple[str, dict[str, object]]]:
+        """Yield ``(property_key, record)`` pairs, dropping records whose property was already seen."""
+
+        # Keys are remembered in packed integer form, roughly half the memory of the key strings over a long stream.
+        seen_properties: set[int] = set()
         for index, record in enumerate(records, start=1):
-            property_key = self._build_property_key(record, index)
+            property_key, identity = self._build_property_key(record, index)
 
-            if property_key in seen_properties:
+            if identity in seen_properties:
                 continue
-            seen_properties.add(property_key)
-
-            property_payload = {
-                "property_key": property_key,
-                **self._project_fields(record, self.property_fields),
-            }
-            property_model = PropertyRecord(**property_payload)
-            properties.append(property_model)
-
-            lead_payload = {
-                "property_key": property_key,
-                **self._project_fields(record, self.lead_fields),
-            }
-            if self._has_meaningful_payload(lead_payload, skip_keys={"property_key"}):
-                leads.append(LeadRecord(**lead_payload))
-
-            taxes_payload = {
-                "property_key": property_key,
-                **self._project_fields(record, self.tax_fields),
-            }
-            if self._has_meaningful_payload(taxes_payload, skip_keys={"property_key"}):
-                taxes.append(TaxRecord(**taxes_payload))
-
-            valuation_scenarios = iter_scenarios(record.get("Valuation"))
-            for scenario_rank, scenario in valuation_scenarios:
-                valuation_payload = {
-                    "property_key": property_key,
-                    "scenario_rank": scenario_rank,
-                    **self._project_fields(scenario, self.valuation_fields),
-                }
-                if self._has_meaningful_payload(valuation_payload, skip_keys={"property_key", "scenario_rank"}):
-                    valuations.append(ValuationRecord(**valuation_payload))
-
-            rehab_scenarios = iter_scenarios(record.get("Rehab"))
-            for scenario_rank, scenario in rehab_scenarios:
-                rehab_payload = {
-                    "property_key": property_key,
-                    "scenario_rank": scenario_rank,
-                    **self._project_fields(scenario, self.rehab_fields),
-                }
-                if self._has_meaningful_payload(rehab_payload, skip_keys={"property_key", "scenario_rank"}):
-                    rehabs.append(RehabRecord(**rehab_payload))
-
-            hoa_scenarios = iter_scenarios(record.get("HOA"))
-            for scenario_rank, scenario in hoa_scenarios:
-                hoa_payload = {
-                    "property_key": property_key,
-                    "scenario_rank": scenario_rank,
-                    **self._project_fields(scenario, self.hoa_fields),
-                }
-                if self._has_meaningful_payload(hoa_payload, skip_keys={"property_key", "scenario_rank"}):
-                    hoas.append(HOARecord(**hoa_payload))
+            seen_properties.add(identity)
+            yield property_key, record
 
-        return NormalizedBundle(
-            properties=properties,
-            leads=leads,
-            valuations=valuations,
-            rehabs=rehabs,
-            hoas=hoas,
-            taxes=taxes,
-        )
+    def iter_keyed_bundles(
+        self,
+        keyed_records: Iterable[tuple[str, dict[str, object]]],
+        batch_size: int | None = None,
+    ) -> Iterator[NormalizedBundle]:
+        """Transform already de-duplicated ``(property_key, record)`` pairs into validated bundles."""
+
+        pending = _PendingPayloads()
+        for property_key, record in keyed_records:
+            self._collect_payloads(record, property_key, pending)
+            if batch_size is not None and pending.largest_table_size() >= batch_size:
+                yield pending.validate()
+                pending = _PendingPayloads()
+
+        if pending.properties:
+            yield pending.validate()
+
+    def _collect_payloads(self, record: dict[str, object], property_key: str, pending: _PendingPayloads) -> None:
+        pending.properties.append(self._property_payload(record, property_key))
+
+        # Meaningfulness is judged on the projected data columns alone, before the key column is attached.
+        lead_fields = self._project_lead(record)
+        if self._has_meaningful_payload(lead_fields):
+            pending.leads.append({"property_key": property_key, **lead_fields})
+
+        tax_fields = self._project_tax(record)
+        if self._has_meaningful_payload(tax_fields):
+            pending.taxes.append({"property_key": property_key, **tax_fields})
+
+        self._collect_scenarios(record.get("Valuation"), property_key, self._project_valuation, pending.valuations)
+        self._collect_scenarios(record.get("Rehab"), property_key, self._project_rehab, pending.rehabs)
+        self._collect_scenarios(record.get("HOA"), property_key, self._project_hoa, pending.hoas)
+
+    def _property_payload(self, record: dict[str, object], property_key: str) -> dict[str, object]:
+        return {"property_key": property_key, **self._project_property(record)}
+
+    def _collect_scenarios(
+        self,
+        raw_value: object,
+        property_key: str,
+        project: Projector,
+        bucket: list[dict[str, object]],
+    ) -> None:
+        # Key columns are attached only once the scenario has a meaningful value.
+        for scenario_rank, scenario in iter_scenarios(raw_value):
+            projected = project(scenario)
+            if self._has_meaningful_payload(projected):
+                bucket.append({"property_key": property_key, "scenario_rank": scenario_rank, **projected})
+
+    @staticmethod
+    def _group_columns_by_table(field_config: pd.DataFrame | None) -> dict[str, list[object]]:
+        """Group the configured column names by lower-cased target table in one pass, keeping row order."""
+
+        if field_config is None:
+            return {}
+        tables = field_config["Target Table"].astype(str).str.lower()
+        return field_config["Column Name"].groupby(tables, sort=False).agg(list).to_dict()
 
     def _build_field_map(
         self,
         table_name: str,
         overrides: dict[str, str] | None = None,
     ) -> dict[str, str]:
-        if self.field_config is None:
-            return {}
-
-        filtered = self.field_config[
-            self.field_config["Target Table"].astype(str).str.lower() == table_name.lower()
-        ]["Column Name"]
-
         mapping: dict[str, str] = {}
-        for column_name in filtered:
+        for column_name in self._columns_by_table.get(table_name.lower(), ()):
             if not isinstance(column_name, str):
                 continue
             normalized = overrides.get(column_name) if overrides else None
@@ -149,56 +287,97 @@ class DatasetTransformer:
             mapping[column_name] = normalized
         return mapping
 
-    def _project_fields(self, source: dict[str, object] | None, mapping: dict[str, str]) -> dict[str, object]:
-        if not source:
-            return {}
-        projected: dict[str, object] = {}
-        for raw_key, target_key in mapping.items():
-            if raw_key in source:
-                projected[target_key] = source.get(raw_key)
-        return projected
+    def _build_property_key(self, record: dict[str, object], index: int) -> tuple[str, int]:
+        """Return the property key and an equivalent integer identity (state prefix and raw digest bytes)."""
 
-    def _build_property_key(self, record: dict[str, object], index: int) -> str:
         components: list[str] = []
-        for key in ("Street_Address", "City", "State", "Zip"):
-            value = normalize_string(record.get(key))
+        for key in _KEY_FIELDS:
+            value = _key_component(record.get(key))
             if value:
-                components.append(value.lower())
+                components.append(value)
         if not components:
             fallback = normalize_string(record.get("Property_Title")) or normalize_string(record.get("Address"))
             if fallback:
                 components.append(fallback.lower())
         seed = "||".join(components) or f"record-{index}"
-        digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:16]
+        digest = hashlib.sha256(seed.encode("utf-8")).digest()[:8]
         state = normalize_string(record.get("State"))
         state_prefix = (state or "XX").upper()
-        return f"{state_prefix}-{digest}"
+        return f"{state_prefix}-{digest.hex()}", int.from_bytes(state_prefix.encode("utf-8") + digest, "big")
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _to_snake_case(value: str) -> str:
-        sanitized = value.replace(" ", "_").replace("-", "_")
-        result: list[str] = []
-        prev_lower = False
-        for char in sanitized:
-            if char.isupper() and prev_lower:
-                result.append("_")
-            result.append(char.lower())
-            prev_lower = char.islower()
-        snake = "".join(result)
-        snake = snake.replace("__", "_")
-        return snake
+        # Field names are ASCII workbook headers; an underscore goes between a lower-case letter and
+        # the capital that follows it.
+        snake = _CAMEL_BOUNDARY("_", value.translate(_SNAKE_SEPARATORS)).lower()
+        return snake.replace("__", "_")
 
     @staticmethod
-    def _has_meaningful_payload(payload: dict[str, object], skip_keys: set[str]) -> bool:
-        for key, value in payload.items():
-            if key in skip_keys:
-                continue
+    def _has_meaningful_payload(fields: dict[str, object]) -> bool:
+        for value in fields.values():
             if value is not None and value != "":
                 return True
         return False
 
-    def iter_property_records(self, data: Iterable[dict[str, object]]) -> Iterator[PropertyRecord]:
-        """Yield property records for streaming use-cases."""
+    def iter_property_records(
+        self,
+        data: Iterable[dict[str, object]],
+        batch_size: int = 1000,
+    ) -> Iterator[PropertyRecord]:
+        """Yield property records for streaming use-cases, projecting and validating only the property table."""
+
+        payloads: list[dict[str, object]] = []
+        for property_key, record in self.iter_unique_records(data):
+            payloads.append(self._property_payload(record, property_key))
+            if len(payloads) >= batch_size:
+                yield from _validate_batch(PROPERTY_ADAPTER, PropertyRecord, payloads)
+                payloads = []
+        if payloads:
+            yield from _validate_batch(PROPERTY_ADAPTER, PropertyRecord, payloads)
+
+
+def _compile_projector(items: FieldItems) -> Projector:
+    """Generate a projection for one field map as straight-line code, without a per-field loop.
+
+    Missing source keys stay absent from the result, and a repeated target keeps its last source.
+    """
+
+    lines = ["def project(source):", "    if not source:", "        return {}", "    projected = {}"]
+    for raw_key, target_key in items:
+        lines.append(f"    if {raw_key!r} in source:")
+        lines.append(f"        projected[{target_key!r}] = source[{raw_key!r}]")
+    lines.append("    return projected")
+    namespace: dict[str, object] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102 - literals come from repr() of the field map
+    return namespace["project"]
+
+
+def _key_component(value: object) -> str | None:
+    if isinstance(value, str):
+        return _lowered_text(value)
+    text = normalize_string(value)
+    return text.lower() if text else None
+
+
+# Address parts (cities, states, zips) repeat across records; only strings are cached so that values
+# such as ``True`` and ``1``, which hash alike, never share an entry.
+@lru_cache(maxsize=1 << 16)
+def _lowered_text(value: str) -> str | None:
+    text = normalize_string(value)
+    return text.lower() if text else None
+
+
+# Transformer installed in each worker process by ``_init_transform_worker``.
+_WORKER_TRANSFORMER: DatasetTransformer | None = None
+
+
+def _init_transform_worker(transformer: DatasetTransformer) -> None:
+    global _WORKER_TRANSFORMER
+    _WORKER_TRANSFORMER = transformer
+
 
-        bundle = self.transform(data)
-        yield from bundle.properties
+def _transform_chunk(chunk: list[tuple[str, dict[str, object]]], batch_size: int) -> list[NormalizedBundle]:
+    if _WORKER_TRANSFORMER is None:  # pragma: no cover - initializer always runs first
+        raise RuntimeError("Transform worker was not initialized")
+    return list(_WORKER_TRANSFORMER.iter_keyed_bundles(chunk, batch_size))
@@ -4,6 +4,7 @@ from __future__ import annotations
 import math
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any, Iterable, Optional
 
 _StrOrBytes = (str, bytes)
@@ -24,38 +25,54 @@ _NUMBER_WORDS = {
     "twelve": 12,
 }
 
-_WHITESPACE_RE = re.compile(r"\s+")
 _NON_DIGIT_RE = re.compile(r"[^0-9.-]")
 _BOOLEAN_TRUE = {"y", "yes", "true", "1"}
 _BOOLEAN_FALSE = {"n", "no", "false", "0"}
-_NULL_TOKENS = {None, "", " ", "na", "n/a", "null", "none", "unknown"}
+# Largest magnitude below which every integral float converts to int exactly via its repr.
+_MAX_EXACT_FLOAT_INT = 2**53
+_NULL_STR_TOKENS = frozenset({"", " ", "na", "n/a", "null", "none", "unknown"})
+
+
+def _is_null(value: Any) -> bool:
+    """Return True for ``None`` and the raw null tokens; never hashes non-string values."""
+
+    return value is None or (isinstance(value, str) and value in _NULL_STR_TOKENS)
 
 
 def normalize_string(value: Any) -> Optional[str]:
     """Standardize string values, stripping whitespace and empty tokens."""
 
-    if value in _NULL_TOKENS:
+    if value is None:
         return None
 
-    if isinstance(value, bytes):
-        value = value.decode("utf-8", errors="ignore")
-
     if isinstance(value, str):
-        text = value.strip()
-        if not text:
-            return None
-        return _WHITESPACE_RE.sub(" ", text)
+        return None if value in _NULL_STR_TOKENS else _normalize_text(value)
+
+    if isinstance(value, bytes):
+        return _normalize_text(value.decode("utf-8", errors="ignore"))
 
     return str(value)
 
 
+# Categorical text (states, cities, flags, units) repeats heavily across records, so the string
+# normalizers memoize their pure string-to-result step.
+@lru_cache(maxsize=1 << 16)
+def _normalize_text(value: str) -> Optional[str]:
+    # ``str.split()`` breaks on exactly the characters ``\s`` matches, so this strips and collapses
+    # whitespace runs in C without a regex pass.
+    text = " ".join(value.split())
+    return text or None
+
+
 def normalize_bool(value: Any) -> Optional[bool]:
     """Coerce loosely formatted boolean-like values into canonical booleans."""
 
-    if value in _NULL_TOKENS:
-        return None
-
-    if isinstance(value, bool):
+    # Exact ``str`` (the dominant parsed input) is dispatched first; subclasses, bytes and numbers follow.
+    # String null tokens are rejected by ``normalize_string`` in the text branches.
+    kind = type(value)
+    if kind is str:
+        return _bool_from_str(value)
+    if value is None or kind is bool:
         return value
 
     if isinstance(value, (int, float)):
@@ -64,34 +81,50 @@ def normalize_bool(value: Any) -> Optional[bool]:
         return bool(value)
 
     if isinstance(value, _StrOrBytes):
-        text = normalize_string(value)
-        if text is None:
-            return None
-        lowered = text.lower()
-        if lowered in _BOOLEAN_TRUE:
-            return True
-        if lowered in _BOOLEAN_FALSE:
-            return False
+        return _bool_from_text(normalize_string(value))
 
     return None
 
 
+@lru_cache(maxsize=1 << 10)
+def _bool_from_str(value: str) -> Optional[bool]:
+    return _bool_from_text(normalize_string(value))
+
+
+def _bool_from_text(text: Optional[str]) -> Optional[bool]:
+    if text is None:
+        return None
+    lowered = text.lower()
+    if lowered in _BOOLEAN_TRUE:
+        return True
+    if lowered in _BOOLEAN_FALSE:
+        return False
+    return None
+
+
 def _extract_number_from_string(value: str) -> str:
     """Remove non-numeric characters except sign and decimal point."""
 
     cleaned = _NON_DIGIT_RE.sub("", value)
-    if cleaned.count("-") > 1:
-        cleaned = cleaned.replace("-", "", cleaned.count("-") - 1)
+    dashes = cleaned.count("-")
+    if dashes > 1:
+        # Only the last sign survives.
+        cleaned = cleaned.replace("-", "", dashes - 1)
     if cleaned.count(".") > 1:
-        first, *rest = cleaned.split(".")
-        cleaned = first + "." + "".join(rest)
+        # Keep the first decimal point and drop the rest.
+        integral, _, fraction = cleaned.partition(".")
+        cleaned = integral + "." + fraction.replace(".", "")
     return cleaned
 
 
 def normalize_decimal(value: Any) -> Optional[Decimal]:
     """Coerce numbers stored as messy strings into Decimal instances."""
 
-    if value in _NULL_TOKENS:
+    # Exact ``str`` first, as in ``normalize_bool``.
+    if type(value) is str:
+        text = normalize_string(value)
+        return None if text is None else _decimal_from_text(text)
+    if value is None:
         return None
 
     if isinstance(value, Decimal):
@@ -106,26 +139,49 @@ def normalize_decimal(value: Any) -> Optional[Decimal]:
         text = normalize_string(value)
         if text is None:
             return None
+        return _decimal_from_text(text)
 
-        lowered = text.lower()
-        if lowered in _NUMBER_WORDS:
-            return Decimal(_NUMBER_WORDS[lowered])
+    return None
 
-        candidate = _extract_number_from_string(lowered)
-        if not candidate:
-            return None
-        try:
-            return Decimal(candidate)
-        except InvalidOperation:
-            return None
 
-    return None
+@lru_cache(maxsize=1 << 16)
+def _decimal_from_text(text: str) -> Optional[Decimal]:
+    lowered = text.lower()
+    if lowered in _NUMBER_WORDS:
+        return Decimal(_NUMBER_WORDS[lowered])
+
+    candidate = _extract_number_from_string(lowered)
+    if not candidate:
+        return None
+    try:
+        return Decimal(candidate)
+    except InvalidOperation:
+        return None
 
 
 def normalize_int(value: Any) -> Optional[int]:
     """Int-specific convenience wrapper around :func:`normalize_decimal`."""
 
-    decimal_value = normalize_decimal(value)
+    # Already-numeric inputs whose value is exact as an int skip the Decimal round-trip; bools and
+    # floats outside the exactly representable range keep the Decimal semantics.
+    kind = type(value)
+    if kind is int:
+        return value
+    if kind is float and value.is_integer() and abs(value) <= _MAX_EXACT_FLOAT_INT:
+        return int(value)
+    if kind is str:
+        return _int_from_str(value)
+    return _decimal_to_int(normalize_decimal(value))
+
+
+# Text cells repeat, so the string paths of the int/float wrappers cache their final result. Rounding still
+# goes through Decimal: ROUND_HALF_UP on the exact value differs from float rounding (``"2.4999999999999999"``).
+@lru_cache(maxsize=1 << 16)
+def _int_from_str(value: str) -> Optional[int]:
+    return _decimal_to_int(normalize_decimal(value))
+
+
+def _decimal_to_int(decimal_value: Optional[Decimal]) -> Optional[int]:
     if decimal_value is None:
         return None
     try:
@@ -137,17 +193,47 @@ def normalize_int(value: Any) -> Optional[int]:
 def normalize_float(value: Any) -> Optional[float]:
     """Float-specific convenience wrapper around :func:`normalize_decimal`."""
 
-    decimal_value = normalize_decimal(value)
-    if decimal_value is None:
+    # A float round-trips through ``Decimal(str(value))`` unchanged, so only NaN needs handling. Ints beyond
+    # ``_MAX_EXACT_FLOAT_INT`` keep the Decimal path, which yields ``inf`` where ``float(value)`` would raise.
+    kind = type(value)
+    if kind is float:
+        return None if math.isnan(value) else value
+    if kind is int and abs(value) <= _MAX_EXACT_FLOAT_INT:
+        return float(value)
+    if kind is str:
+        return _float_from_str(value)
+    return _decimal_to_float(normalize_decimal(value))
+
+
+@lru_cache(maxsize=1 << 16)
+def _float_from_str(value: str) -> Optional[float]:
+    # Unlike the int path there is no rounding step, and ``float()`` of the extracted literal is correctly
+    # rounded just like ``float(Decimal(...))``, so the Decimal is skipped.
+    text = normalize_string(value)
+    if text is None:
         return None
-    return float(decimal_value)
+    lowered = text.lower()
+    if lowered in _NUMBER_WORDS:
+        return float(_NUMBER_WORDS[lowered])
+
+    candidate = _extract_number_from_string(lowered)
+    if not candidate:
+        return None
+    try:
+        return float(candidate)
+    except ValueError:
+        return None
+
+
+def _decimal_to_float(decimal_value: Optional[Decimal]) -> Optional[float]:
+    return None if decimal_value is None else float(decimal_value)
 
 
 def coalesce(*values: Any) -> Optional[Any]:
     """Return the first non-null value from the provided sequence."""
 
     for value in values:
-        if value not in _NULL_TOKENS:
+        if not _is_null(value):
             return value
     return None
 